@@ -0,0 +1 @@
+Add `LegacyRecordBatch.validate_framing()` to check message framing without computing a CRC over the payload
@@ -1,6 +1,3 @@
-import inspect
-import sys
-
 from kafka.errors import (
     KafkaError,
     IllegalStateError,
@@ -71,7 +68,7 @@ from kafka.errors import (
     KafkaConnectionError,
 )
 
-__all__ = [
+__all__ = (
     # aiokafka custom errors
     "ConsumerStoppedError", "NoOffsetForPartitionError", "RecordTooLargeError",
     "ProducerClosed",
@@ -144,7 +141,7 @@ __all__ = [
     "KafkaUnavailableError",
     "KafkaTimeoutError",
     "KafkaConnectionError",
-]
+)
 
 
 class CoordinatorNotAvailableError(GroupCoordinatorNotAvailableError):
@@ -413,15 +410,27 @@ class ListenerNotFound(BrokerResponseError):
     )
 
 
-def _iter_broker_errors():
-    for name, obj in inspect.getmembers(sys.modules[__name__]):
-        if inspect.isclass(obj) and issubclass(obj, BrokerResponseError) and \
-                obj != BrokerResponseError:
-            yield obj
+class _BrokerErrorTable(dict):
+    """ errno -> error class mapping, that resolves unknown codes to
+        UnknownError instead of raising KeyError.
+    """
+
+    def __missing__(self, error_code):
+        return UnknownError
+
+
+def _collect_broker_errors(namespace, out):
+    for obj in namespace.values():
+        if isinstance(obj, type) and issubclass(obj, BrokerResponseError) \
+                and obj is not BrokerResponseError:
+            out[obj.errno] = obj
+    return out
 
 
-kafka_errors = {x.errno: x for x in _iter_broker_errors()}
+kafka_errors = _collect_broker_errors(globals(), {})
 
+# Private copy for `for_code`, so `kafka_errors` stays a plain dict
+_errors_by_code = _BrokerErrorTable(kafka_errors)
 
-def for_code(error_code):
-    return kafka_errors.get(error_code, UnknownError)
+# Bound C-level lookup, avoids a Python frame per error code resolution
+for_code = _errors_by_code.__getitem__
@@ -9,6 +9,12 @@ cdef class LegacyRecordBatch:
         char _magic
         int _decompressed
         LegacyRecord _main_record
+        # Length field and size of the wrapper message and the position,
+        # where its key and value end. Kept as the buffer is replaced on
+        # decompression.
+        Py_ssize_t _length
+        Py_ssize_t _wrapper_len
+        Py_ssize_t _main_record_end
 
     @staticmethod
     cdef inline LegacyRecordBatch new(
@@ -19,6 +25,7 @@ cdef class LegacyRecordBatch:
     cdef inline int _check_bounds(
             self, Py_ssize_t pos, Py_ssize_t size) except -1
     cdef LegacyRecord _read_record(self, Py_ssize_t* read_pos)
+    cdef int _read_main_record(self) except -1
 
 
 cdef class LegacyRecord:
@@ -63,7 +63,7 @@ cdef class LegacyRecordBatch:
         PyObject_GetBuffer(buffer, &self._buffer, PyBUF_SIMPLE)
         self._magic = magic
         self._decompressed = 0
-        self._main_record = self._read_record(NULL)
+        self._read_main_record()
 
     @staticmethod
     cdef inline LegacyRecordBatch new(
@@ -84,7 +84,7 @@ cdef class LegacyRecordBatch:
 
         batch._magic = magic
         batch._decompressed = 0
-        batch._main_record = batch._read_record(NULL)
+        batch._read_main_record()
         return batch
 
     def __dealloc__(self):
@@ -109,6 +109,17 @@ cdef class LegacyRecordBatch:
 
         return self._main_record.crc == <uint32_t> crc
 
+    def validate_framing(self):
+        """ Cheap sanity check, that the header size together with the key and
+            value length fields adds up to the message length. Key and value
+            bytes are not read, so unlike `validate_crc` this does not detect
+            payload corruption.
+        """
+        return (
+            self._length == self._wrapper_len - LOG_OVERHEAD and
+            self._main_record_end == self._wrapper_len
+        )
+
     cdef int _decompress(self, char compression_type) except -1:
         cdef:
             bytes value
@@ -215,6 +226,21 @@ cdef class LegacyRecordBatch:
         return LegacyRecord.new(
             offset, timestamp, attrs, key=key, value=value, crc=crc)
 
+    cdef int _read_main_record(self) except -1:
+        """ Read the wrapper message and remember its framing, as `_buffer` is
+        replaced by the decompressed payload later.
+        """
+        cdef:
+            Py_ssize_t pos = 0
+            char* buf
+
+        self._main_record = self._read_record(&pos)
+        buf = <char*> self._buffer.buf
+        self._length = <Py_ssize_t> hton.unpack_int32(&buf[LENGTH_OFFSET])
+        self._wrapper_len = self._buffer.len
+        self._main_record_end = pos
+        return 0
+
     def __iter__(self):
         cdef:
             char compression
@@ -357,6 +383,10 @@ cdef class LegacyRecordBatchBuilder:
             int64_t ts
             LegacyRecordMetadata metadata
             uint32_t crc
+            Py_buffer key_buf
+            Py_buffer value_buf
+            Py_buffer *key_ptr = NULL
+            Py_buffer *value_ptr = NULL
 
         if self._magic == 0:
             ts = -1
@@ -365,21 +395,40 @@ cdef class LegacyRecordBatchBuilder:
         else:
             ts = timestamp
 
-        # Check if we have room for another message
-        pos = PyByteArray_GET_SIZE(self._buffer)
-        size = _size_in_bytes(self._magic, key, value)
-        # We always allow at least one record to be appended
-        if offset != 0 and pos + size >= self._batch_size:
-            return None
-
-        # Allocate proper buffer length
-        PyByteArray_Resize(self._buffer, pos + size)
-
-        # Encode message
-        buf = PyByteArray_AS_STRING(self._buffer)
-        _encode_msg(
-            self._magic, pos, buf,
-            offset, ts, key, value, 0, &crc)
+        # Buffers are acquired only once per message and reused for both size
+        # calculation and encoding. Acquiring also serves as the type check,
+        # as it raises TypeError for anything, that is not bytes-like.
+        try:
+            if key is not None:
+                PyObject_GetBuffer(key, &key_buf, PyBUF_SIMPLE)
+                key_ptr = &key_buf
+            if value is not None:
+                PyObject_GetBuffer(value, &value_buf, PyBUF_SIMPLE)
+                value_ptr = &value_buf
+
+            # Check if we have room for another message
+            pos = PyByteArray_GET_SIZE(self._buffer)
+            size = _size_in_bytes(
+                self._magic,
+                key_buf.len if key_ptr != NULL else 0,
+                value_buf.len if value_ptr != NULL else 0)
+            # We always allow at least one record to be appended
+            if offset != 0 and pos + size >= self._batch_size:
+                return None
+
+            # Allocate proper buffer length
+            PyByteArray_Resize(self._buffer, pos + size)
+
+            # Encode message
+            buf = PyByteArray_AS_STRING(self._buffer)
+            _encode_msg(
+                self._magic, pos, buf,
+                offset, ts, key_ptr, value_ptr, 0, &crc)
+        finally:
+            if key_ptr != NULL:
+                PyBuffer_Release(key_ptr)
+            if value_ptr != NULL:
+                PyBuffer_Release(value_ptr)
 
         metadata = LegacyRecordMetadata.new(offset, crc, size, ts)
         return metadata
@@ -394,7 +443,8 @@ cdef class LegacyRecordBatchBuilder:
     def size_in_bytes(self, offset, timestamp, key, value):
         """ Actual size of message to add
         """
-        return _size_in_bytes(self._magic, key, value)
+        return _size_in_bytes(
+            self._magic, _buffer_len(key), _buffer_len(value))
 
     @staticmethod
     def record_overhead(char magic):
@@ -409,6 +459,7 @@ cdef class LegacyRecordBatchBuilder:
             char *buf
             Py_ssize_t size
             uint32_t crc
+            Py_buffer value_buf
 
         if self._compression_type != 0:
             if self._compression_type == _ATTR_CODEC_GZIP:
@@ -422,15 +473,19 @@ cdef class LegacyRecordBatchBuilder:
                     compressed = lz4_encode(bytes(self._buffer))
             else:
                 return 0
-            size = _size_in_bytes(self._magic, key=None, value=compressed)
-            # We will just write the result into the same memory space.
-            PyByteArray_Resize(self._buffer, size)
-
-            buf = PyByteArray_AS_STRING(self._buffer)
-            _encode_msg(
-                self._magic, start_pos=0, buf=buf,
-                offset=0, timestamp=0, key=None, value=compressed,
-                attributes=self._compression_type, crc_out=&crc)
+            PyObject_GetBuffer(compressed, &value_buf, PyBUF_SIMPLE)
+            try:
+                size = _size_in_bytes(self._magic, 0, value_buf.len)
+                # We will just write the result into the same memory space.
+                PyByteArray_Resize(self._buffer, size)
+
+                buf = PyByteArray_AS_STRING(self._buffer)
+                _encode_msg(
+                    self._magic, start_pos=0, buf=buf,
+                    offset=0, timestamp=0, key=NULL, value=&value_buf,
+                    attributes=self._compression_type, crc_out=&crc)
+            finally:
+                PyBuffer_Release(&value_buf)
             return 1
         return 0
 
@@ -440,28 +495,23 @@ cdef class LegacyRecordBatchBuilder:
         return self._buffer
 
 
-cdef Py_ssize_t _size_in_bytes(char magic, object key, object value) except -1:
-    """ Actual size of message to add
-    """
+cdef inline Py_ssize_t _buffer_len(object obj) except -1:
     cdef:
         Py_buffer buf
-        Py_ssize_t key_len
-        Py_ssize_t value_len
+        Py_ssize_t buf_len
 
-    if key is None:
-        key_len = 0
-    else:
-        PyObject_GetBuffer(key, &buf, PyBUF_SIMPLE)
-        key_len = buf.len
-        PyBuffer_Release(&buf)
+    if obj is None:
+        return 0
+    PyObject_GetBuffer(obj, &buf, PyBUF_SIMPLE)
+    buf_len = buf.len
+    PyBuffer_Release(&buf)
+    return buf_len
 
-    if value is None:
-        value_len = 0
-    else:
-        PyObject_GetBuffer(value, &buf, PyBUF_SIMPLE)
-        value_len = buf.len
-        PyBuffer_Release(&buf)
 
+cdef inline Py_ssize_t _size_in_bytes(
+        char magic, Py_ssize_t key_len, Py_ssize_t value_len):
+    """ Actual size of message to add
+    """
     if magic == 0:
         return LOG_OVERHEAD + RECORD_OVERHEAD_V0_DEF + key_len + value_len
     else:
@@ -470,13 +520,13 @@ cdef Py_ssize_t _size_in_bytes(char magic, object key, object value) except -1:
 
 cdef int _encode_msg(
         char magic, Py_ssize_t start_pos, char *buf,
-        int64_t offset, int64_t timestamp, object key, object value,
+        int64_t offset, int64_t timestamp, Py_buffer *key, Py_buffer *value,
         char attributes, uint32_t* crc_out) except -1:
     """ Encode msg data into the `msg_buffer`, which should be allocated
-        to at least the size of this message.
+        to at least the size of this message. Pass NULL for `key` or `value`
+        to encode None.
     """
     cdef:
-        Py_buffer key_val_buf
         Py_ssize_t pos = start_pos
         int32_t length
         unsigned long crc = 0
@@ -484,27 +534,23 @@ cdef int _encode_msg(
     # Write key and value
     pos += KEY_OFFSET_V0 if magic == 0 else KEY_OFFSET_V1
 
-    if key is None:
+    if key == NULL:
         hton.pack_int32(&buf[pos], -1)
         pos += KEY_LENGTH
     else:
-        PyObject_GetBuffer(key, &key_val_buf, PyBUF_SIMPLE)
-        hton.pack_int32(&buf[pos], <int32_t>key_val_buf.len)
+        hton.pack_int32(&buf[pos], <int32_t>key.len)
         pos += KEY_LENGTH
-        memcpy(&buf[pos], <char*>key_val_buf.buf, <size_t>key_val_buf.len)
-        pos += key_val_buf.len
-        PyBuffer_Release(&key_val_buf)
+        memcpy(&buf[pos], <char*>key.buf, <size_t>key.len)
+        pos += key.len
 
-    if value is None:
+    if value == NULL:
         hton.pack_int32(&buf[pos], -1)
         pos += VALUE_LENGTH
     else:
-        PyObject_GetBuffer(value, &key_val_buf, PyBUF_SIMPLE)
-        hton.pack_int32(&buf[pos], <int32_t>key_val_buf.len)
+        hton.pack_int32(&buf[pos], <int32_t>value.len)
         pos += VALUE_LENGTH
-        memcpy(&buf[pos], <char*>key_val_buf.buf, <size_t>key_val_buf.len)
-        pos += key_val_buf.len
-        PyBuffer_Release(&key_val_buf)
+        memcpy(&buf[pos], <char*>value.buf, <size_t>value.len)
+        pos += value.len
     length = <int32_t> ((pos - start_pos) - LOG_OVERHEAD)
 
     # Write msg header. Note, that Crc should be updated last
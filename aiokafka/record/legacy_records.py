@@ -1,7 +1,7 @@
 import struct
 import time
 
-from binascii import crc32
+from zlib import crc32
 
 from aiokafka.errors import CorruptRecordException
 from aiokafka.util import NO_EXTENSIONS
@@ -89,10 +89,12 @@ class _LegacyRecordBatchPy(LegacyRecordBase):
         assert magic == magic_
 
         self._offset = offset
+        self._length = length
         self._crc = crc
         self._timestamp = timestamp
         self._attributes = attrs
         self._decompressed = False
+        self._main_record_end = self._read_main_record_end()
 
     @property
     def timestamp_type(self):
@@ -120,6 +122,35 @@ class _LegacyRecordBatchPy(LegacyRecordBase):
         crc = crc32(self._buffer[self.MAGIC_OFFSET:])
         return self._crc == crc
 
+    def validate_framing(self):
+        """ Cheap sanity check, that the header size together with the key and
+            value length fields adds up to the message length. Key and value
+            bytes are not read, so unlike `validate_crc` this does not detect
+            payload corruption.
+        """
+        return self._main_record_end == self._length + self.LOG_OVERHEAD
+
+    def _read_main_record_end(self):
+        """ Walk the key and value length fields of the wrapper message and
+            return the position where its value ends, -1 if it's out of range
+        """
+        if self._magic == 1:
+            pos = self.KEY_OFFSET_V1
+        else:
+            pos = self.KEY_OFFSET_V0
+        buffer_len = len(self._buffer)
+        # Key length, then value length
+        for length_size in (self.KEY_LENGTH, self.VALUE_LENGTH):
+            if pos + length_size > buffer_len:
+                return -1
+            size = struct.unpack_from(">i", self._buffer, pos)[0]
+            pos += length_size
+            if size != -1:
+                if size < 0:
+                    return -1
+                pos += size
+        return pos
+
     def _decompress(self, key_offset):
         # Copy of `_read_key_value`, but uses memoryview
         pos = key_offset
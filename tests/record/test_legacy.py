@@ -79,6 +79,64 @@ def test_read_write_serde_v0_v1_with_compression(compression_type, magic):
             0xffffffff
 
 
+@pytest.mark.parametrize("magic", [0, 1])
+def test_validate_framing(magic):
+    builder = LegacyRecordBatchBuilder(
+        magic=magic, compression_type=0, batch_size=1024 * 1024)
+    builder.append(0, timestamp=9999999, key=b"test", value=b"Super")
+    buffer = builder.build()
+
+    batch = LegacyRecordBatch(bytes(buffer), magic)
+    assert batch.validate_framing()
+
+    # Corrupting the payload is not detected, only CRC validation covers it
+    corrupted = bytearray(buffer)
+    corrupted[-1] ^= 0xff
+    batch = LegacyRecordBatch(corrupted, magic)
+    assert batch.validate_framing()
+    assert not batch.validate_crc()
+
+    # Value length field, that does not add up to the message length
+    value_length_offset = (26 if magic else 18) + 4 + len(b"test")
+    struct.pack_into(">i", buffer, value_length_offset, len(b"Super") - 1)
+    batch = LegacyRecordBatch(buffer, magic)
+    assert not batch.validate_framing()
+
+
+@pytest.mark.parametrize("magic", [0, 1])
+def test_validate_framing_length(magic):
+    builder = LegacyRecordBatchBuilder(
+        magic=magic, compression_type=0, batch_size=1024 * 1024)
+    builder.append(0, timestamp=9999999, key=b"test", value=b"Super")
+    buffer = builder.build()
+
+    # Trailing bytes after the message
+    trailing = bytes(buffer) + b"\x00" * 8
+    # Length field, that does not match the buffer size
+    bad_length = bytearray(buffer)
+    struct.pack_into(">i", bad_length, 8, len(buffer))
+
+    for corrupted in [trailing, bad_length]:
+        # The Python implementation asserts the length on construction, the
+        # C one does not expose its helpers, so we check only that one.
+        if hasattr(LegacyRecordBatch, "_read_main_record_end"):
+            with pytest.raises(AssertionError):
+                LegacyRecordBatch(corrupted, magic)
+        else:
+            batch = LegacyRecordBatch(corrupted, magic)
+            assert not batch.validate_framing()
+
+
+@pytest.mark.parametrize("magic", [0, 1])
+def test_validate_framing_compressed(magic):
+    batch = LegacyRecordBatch(_make_compressed_batch(magic), magic)
+    assert batch.validate_framing()
+
+    # The wrapper message is checked even after it was decompressed
+    assert len(list(batch)) == 10
+    assert batch.validate_framing()
+
+
 @pytest.mark.parametrize("magic", [0, 1])
 def test_written_bytes_equals_size_in_bytes(magic):
     key = b"test"